@@ -5,7 +5,7 @@ The data consists either of cross-sections or rate coefficients.
 import h5py
 import numpy as np
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 class Asigma_loc(DataGroup):
@@ -41,8 +41,8 @@ class Asigma_loc(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Path to hdf5 file.
+        fn : str or `h5py.File`
+            Path to hdf5 file or an already open file.
         nreac : int
             Number of available atomic reactions.
         z1 : array_like (nreac,1)
@@ -101,7 +101,7 @@ class Asigma_loc(DataGroup):
         group  = "asigma_loc"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -137,8 +137,8 @@ class Asigma_loc(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -17,7 +17,7 @@ actual extrema of the interpolation scheme.
 import h5py
 import numpy as np
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 import a5py.physlib.analyticequilibrium as psifun
@@ -52,8 +52,8 @@ class B_TC(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         bxyz : array_like (3,1)
             Magnetic field in cartesian coordinates at origo.
         jacobian : array_like (3,3)
@@ -89,7 +89,7 @@ class B_TC(DataGroup):
         if psival is None:
             psival = rhoval
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -112,8 +112,8 @@ class B_TC(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -171,8 +171,8 @@ class B_GS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         r0 : float
             Major radius R coordinate [m].
         z0 : float
@@ -233,7 +233,7 @@ class B_GS(DataGroup):
             zaxis = x[1]*r0
             psi0 = psi0 - 1e-8 if psi0 < psi1 else psi0 + 1e-8
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -264,8 +264,8 @@ class B_GS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -332,8 +332,8 @@ class B_2DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         rmin : float
             R grid min edge [m].
         rmax : float
@@ -394,7 +394,7 @@ class B_2DS(DataGroup):
         group  = "B_2DS"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -428,8 +428,8 @@ class B_2DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -593,8 +593,8 @@ class B_3DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         b_rmin : float
             Magnetic field data R grid min edge [m].
         b_rmax : float
@@ -682,7 +682,7 @@ class B_3DS(DataGroup):
         bphi = np.transpose(bphi, (2,1,0))
         bz   = np.transpose(bz,   (2,1,0))
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -723,8 +723,8 @@ class B_3DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -871,8 +871,8 @@ class B_3DST(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         b_rmin : float
             Magnetic field data R grid min edge [m].
         b_rmax : float
@@ -966,7 +966,7 @@ class B_3DST(DataGroup):
         bphi = np.transpose(bphi, (3,2,1,0))
         bz   = np.transpose(bz,   (3,2,1,0))
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -1012,8 +1012,8 @@ class B_3DST(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -1076,8 +1076,8 @@ class B_STS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         b_rmin : float
             Magnetic field data R grid min edge [m].
         b_rmax : float
@@ -1181,7 +1181,7 @@ class B_STS(DataGroup):
         bphi = np.transpose(bphi, (2,1,0))
         bz   = np.transpose(bz,   (2,1,0))
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -1233,8 +1233,8 @@ class B_STS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -6,7 +6,7 @@ is used.
 import h5py
 import numpy as np
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 class Boozer(DataGroup):
@@ -70,8 +70,8 @@ class Boozer(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         psimin : float
             Minimum psi grid value.
         psimax : float
@@ -156,7 +156,7 @@ class Boozer(DataGroup):
              theta_psithetageom) )
         nthetag += padding*2
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -205,8 +205,8 @@ class Boozer(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
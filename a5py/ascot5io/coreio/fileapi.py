@@ -54,6 +54,7 @@ import datetime
 
 from importlib.metadata import version as importlib_version
 from collections import OrderedDict
+from contextlib import contextmanager
 from a5py.exceptions import AscotNoDataException, AscotIOException
 
 INPUTGROUPS = ["options", "bfield", "efield", "marker", "plasma", "neutral",
@@ -504,6 +505,64 @@ def get_inputqids(f, rungroup):
 
     return qids
 
+@contextmanager
+def ascot5_writer(fn, mode="a"):
+    """Open the HDF5 file for writing unless it is already open.
+
+    All ``write_hdf5`` methods of the input classes open the file with this
+    function, so they accept an open file as well as a path. Writing several inputs to a file that is kept open avoids
+    flushing the metadata and reopening the file for each input:
+
+    >>> with ascot5_writer("ascot.h5") as f:
+    ...     for data in fields:
+    ...         E_3DS.write_hdf5(f, **data)
+
+    Parameters
+    ----------
+    fn : str or `h5py.File` or `h5py.Group`
+        Path to the HDF5 file or an already open file or its root group.
+    mode : str, optional
+        Mode in which the file is opened if a path was given.
+
+    Yields
+    ------
+    f : `h5py.File`
+        Open HDF5 file which is closed on exit only if it was opened here.
+
+    Raises
+    ------
+    ValueError
+        If a group other than the root group was given, since inputs are
+        always written at the root.
+    """
+    if isinstance(fn, h5py.Group):
+        if fn.name != "/":
+            raise ValueError(
+                "Inputs can only be written to the root group, not to "
+                + fn.name + ".")
+        yield fn.file
+    else:
+        with h5py.File(fn, mode) as f:
+            yield f
+
+def nofill_dcpl():
+    """Create a dataset creation property list that disables fill values.
+
+    Datasets that are written in full when they are created never need fill
+    values, so writing those first and then overwriting them with the data is
+    wasted work, especially for large chunked datasets. Pass the result as
+    ``dcpl`` to `h5py.Group.create_dataset`. A new list is needed for each
+    dataset since h5py adds the filters of that dataset to the list.
+
+    Returns
+    -------
+    dcpl : `h5py.h5p.PropDCID`
+        Dataset creation property list with fill time set to never.
+    """
+    dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+    dcpl.set_fill_time(h5py.h5d.FILL_TIME_NEVER)
+    return dcpl
+
 def add_group(f, parent, group, desc=None):
     """Create a new group. A parent is created if need be.
 
@@ -8,7 +8,7 @@ accomplish this is to use E_TC input.
 import h5py
 import numpy as np
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer, nofill_dcpl
 from .coreio.treedata import DataGroup
 
 class E_TC(DataGroup):
@@ -45,8 +45,8 @@ class E_TC(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         exyz : array_like (3,1)
             Electric field value in cartesian coordinates [V/m].
         desc : str, optional
@@ -69,7 +69,7 @@ class E_TC(DataGroup):
         group  = "E_TC"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -90,8 +90,8 @@ class E_TC(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -142,8 +142,8 @@ class E_3D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         rmin : float
             Minimum value in R grid [m].
         rmax : float
@@ -197,7 +197,7 @@ class E_3D(DataGroup):
         ez   = np.transpose(ez,(2,1,0))
 
         # Create a group for this input.
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -228,8 +228,8 @@ class E_3D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -258,6 +258,10 @@ class E_3DS(DataGroup):
         data : dict
             Data read from HDF5 stored in the same format as is passed to
             :meth:`write_hdf5`.
+
+            The field components are transposed views of the arrays stored in
+            (nz,nphi,nr) order, i.e., they are Fortran-contiguous and no copy
+            is made.
         """
         fn   = self._root._ascot.file_getpath()
         path = self._path
@@ -265,27 +269,69 @@ class E_3DS(DataGroup):
         out = {}
         with h5py.File(fn,"r") as f:
             for key in f[path]:
-                out[key] = f[path][key][:]
+                if key not in ["er", "ephi", "ez"] and \
+                   not key.endswith("_grid"):
+                    out[key] = f[path][key][:]
 
-        out["er"]   = np.transpose(out["er"],   (2,1,0))
-        out["ephi"] = np.transpose(out["ephi"], (2,1,0))
-        out["ez"]   = np.transpose(out["ez"],   (2,1,0))
+            # Components are read directly into a single preallocated buffer
+            field = np.empty((3,) + f[path]["er"].shape, dtype="f8")
+            for i, key in enumerate(["er", "ephi", "ez"]):
+                f[path][key].read_direct(field[i])
+
+        # A single transposed view of the buffer gives all components
+        out["er"], out["ephi"], out["ez"] = np.transpose(field, (0,3,2,1))
         return out
 
+    def grid(self):
+        """Read the grid on which the field components are tabulated.
+
+        The grid is written along with the data so that it is identical for
+        all readers. For inputs written without it, the grid is reconstructed
+        from the stored limits.
+
+        Returns
+        -------
+        r : array_like (nr,)
+            R grid [m].
+        phi : array_like (nphi,)
+            Phi grid [deg].
+        z : array_like (nz,)
+            z grid [m].
+        """
+        fn   = self._root._ascot.file_getpath()
+        path = self._path
+
+        with h5py.File(fn,"r") as f:
+            g = f[path]
+            if "r_grid" in g:
+                return g["r_grid"][:], g["phi_grid"][:], g["z_grid"][:]
+
+            r   = np.linspace(g["rmin"][0], g["rmax"][0], g["nr"][0])
+            phi = np.linspace(g["phimin"][0], g["phimax"][0],
+                              g["nphi"][0]+1)[:-1]
+            z   = np.linspace(g["zmin"][0], g["zmax"][0], g["nz"][0])
+        return r, phi, z
+
     @staticmethod
     def write_hdf5(fn, rmin, rmax, nr, zmin, zmax, nz, phimin, phimax, nphi,
-                   er, ephi, ez, desc=None):
+                   er, ephi, ez, desc=None, precision="f4"):
         """Write input data to the HDF5 file.
 
         The toroidal angle phi is treated as a periodic coordinate, meaning
         ``A(phi=phimin) == A(phi=phimax)``. However, the phi grid, where input
         arrays are tabulated, is ``linspace(phimin, phimax, nphi+1)[:-1]``
-        to avoid storing duplicate data.
+        to avoid storing duplicate data. The grids are stored along with the
+        data and can be read with :meth:`grid`.
+
+        The field components are stored in (nz,nphi,nr) order. Arrays that are
+        Fortran-contiguous, such as those returned by :meth:`read` or created
+        with ``order="F"``, and already in the stored precision are written
+        without an intermediate copy.
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         rmin : float
             Minimum value in R grid [m].
         rmax : float
@@ -312,6 +358,12 @@ class E_3DS(DataGroup):
             Electric field z component [V/m].
         desc : str, optional
             Input description.
+        precision : {"f4", "f8"}, optional
+            Floating point precision in which the field components are stored.
+
+            Single precision halves the file size and is sufficient for
+            tabulated field values. The data is always read back in double
+            precision.
 
         Returns
         -------
@@ -329,6 +381,8 @@ class E_3DS(DataGroup):
             raise ValueError("Ephi has an inconsinstent shape.")
         if ez.shape   != (nr,nphi,nz):
             raise ValueError("Ez has an inconsinstent shape.")
+        if precision not in ["f4", "f8"]:
+            raise ValueError("Precision must be either \"f4\" or \"f8\".")
 
         parent = "efield"
         group  = "E_3DS"
@@ -338,8 +392,21 @@ class E_3DS(DataGroup):
         ephi = np.transpose(ephi,(2,1,0))
         ez   = np.transpose(ez,(2,1,0))
 
+        # Chunks span whole R rows and are at most 1 MiB, which matches the
+        # default chunk cache. Shuffle makes floating point data compressible.
+        nchunk    = 2**20 // np.dtype(precision).itemsize
+        nphichunk = min(nphi, max(1, nchunk // nr))
+        nzchunk   = min(nz, max(1, nchunk // (nr * nphichunk)))
+        chunks    = (nzchunk, nphichunk, nr)
+
+        # Limits may be given as one-element arrays as returned by read()
+        rgrid   = np.linspace(rmin, rmax, int(np.squeeze(nr))).ravel()
+        phigrid = np.linspace(phimin, phimax,
+                              int(np.squeeze(nphi))+1)[:-1].ravel()
+        zgrid   = np.linspace(zmin, zmax, int(np.squeeze(nz))).ravel()
+
         # Create a group for this input.
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -352,9 +419,20 @@ class E_3DS(DataGroup):
             g.create_dataset("zmin",          (1,),  data=zmin,   dtype="f8")
             g.create_dataset("zmax",          (1,),  data=zmax,   dtype="f8")
             g.create_dataset("nz",            (1,),  data=nz,     dtype="i4")
-            g.create_dataset("er",  (nz, nphi, nr),  data=er,     dtype="f8")
-            g.create_dataset("ephi",(nz, nphi, nr),  data=ephi,   dtype="f8")
-            g.create_dataset("ez",  (nz, nphi, nr),  data=ez,     dtype="f8")
+
+            # Grid is stored so that readers need not reconstruct it
+            g.create_dataset("r_grid",   (nr,),   data=rgrid,   dtype="f8")
+            g.create_dataset("phi_grid", (nphi,), data=phigrid, dtype="f8")
+            g.create_dataset("z_grid",   (nz,),   data=zgrid,   dtype="f8")
+
+            # Components share the storage layout and are written in bulk.
+            # Note that h5py serializes all HDF5 calls so writing them from
+            # separate threads would not overlap the compression.
+            for name, data in [("er", er), ("ephi", ephi), ("ez", ez)]:
+                g.create_dataset(name, (nz, nphi, nr), data=data,
+                                 dtype=precision, chunks=chunks, shuffle=True,
+                                 compression="gzip", compression_opts=4,
+                                 dcpl=nofill_dcpl())
 
         return gname
 
@@ -370,8 +448,8 @@ class E_3DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -425,8 +503,8 @@ class E_3DST(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         rmin : float
             Minimum value in R grid [m].
         rmax : float
@@ -486,7 +564,7 @@ class E_3DST(DataGroup):
         ez   = np.transpose(ez,(3,2,1,0))
 
         # Create a group for this input.
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -520,8 +598,8 @@ class E_3DST(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -570,8 +648,8 @@ class E_1DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         nrho : int
             Number of rho slots in data.
         rhomin : float
@@ -604,7 +682,7 @@ class E_1DS(DataGroup):
         parent = "efield"
         group  = "E_1DS"
         gname  = ""
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc)
             gname = g.name.split("/")[-1]
 
@@ -628,8 +706,8 @@ class E_1DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
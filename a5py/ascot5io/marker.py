@@ -6,10 +6,11 @@ import h5py
 import unyt
 
 from .coreio.treedata import DataGroup
-from .coreio.fileapi import read_data, add_group, write_data
+from .coreio.fileapi import read_data, add_group, write_data, \
+    ascot5_writer, nofill_dcpl
 
 from a5py.routines.plotting import openfigureifnoaxes
-from a5py.physlib import parseunits
+from a5py.physlib import parseunits, energy_velocity
 from a5py.physlib.species import species as getspecies
 
 class Marker(DataGroup):
@@ -209,8 +210,8 @@ class FL(Marker):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         n : int
             Number of markers.
         ids : array_like (n,)
@@ -252,7 +253,7 @@ class FL(Marker):
         group  = "fl"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -279,8 +280,8 @@ class FL(Marker):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -345,8 +346,8 @@ class GC(Marker):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         n : int
             Number of markers.
         ids : array_like (n,)
@@ -406,7 +407,7 @@ class GC(Marker):
         group  = "gc"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -439,8 +440,8 @@ class GC(Marker):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -481,33 +482,51 @@ class Prt(Marker):
         del out["id"]
         return out
 
+    def _readfields(self):
+        """Read the marker phase-space and mass with units in a single pass.
+
+        Only the fields needed by :meth:`eval_energy` and :meth:`eval_pitch`
+        are read. They are cached as inputs are not altered once they are
+        written.
+
+        Returns
+        -------
+        data : dict [str, unyt_array]
+            Marker fields with dataset names as keys.
+        """
+        if getattr(self, "_fields", None) is None:
+            with self as h5:
+                self._fields = {key : read_data(h5, key) for key in
+                                ["r", "phi", "z", "vr", "vphi", "vz", "mass"]}
+        return self._fields
+
     def eval_energy(self, ascotpy):
-        with self as h5:
-            vr   = read_data(h5, "vr")
-            vz   = read_data(h5, "vz")
-            vphi = read_data(h5, "vphi")
-            mass = read_data(h5, "mass")
+        data = self._readfields()
+        vr, vz, vphi = data["vr"], data["vz"], data["vphi"]
 
-        v = np.sqrt(vr**2 + vz**2 + vphi**2)
-        return energy_velocity(mass, v)
+        v = np.stack((vr.v, vz.v, vphi.v))
+        v = np.sqrt(_dot(v, v)) * vr.units
+        return energy_velocity(data["mass"], v)
 
     def eval_pitch(self, ascotpy):
-        with self as h5:
-            r    = read_data(h5, "r")
-            z    = read_data(h5, "z")
-            phi  = read_data(h5, "phi")
-            vr   = read_data(h5, "vr")
-            vz   = read_data(h5, "vz")
-            vphi = read_data(h5, "vphi")
-            mass = read_data(h5, "mass")
-
-        br    = ascotpy.evaluate(r, phi, z, 0, "br")
-        bz    = ascotpy.evaluate(r, phi, z, 0, "bz")
-        bphi  = ascotpy.evaluate(r, phi, z, 0, "bphi")
-        b     = np.sqrt(br**2 + bz**2 + bphi**2)
-        v     = np.sqrt(vr**2 + vz**2 + vphi**2)
-        pitch = ( vr * br + vz * bz + vphi * bphi ) / ( b * v )
-        return pitch
+        data = self._readfields()
+        r, phi, z = data["r"], data["phi"], data["z"]
+        vr, vz, vphi = data["vr"], data["vz"], data["vphi"]
+
+        # All components from a single evaluation and a single square root
+        br, bz, bphi = ascotpy.input_eval(r, phi, z, 0*unyt.s,
+                                          "br", "bz", "bphi")
+
+        # Pitch is dimensionless so the products are done without units
+        v = np.stack((vr.v, vz.v, vphi.v))
+        b = np.stack((br.v, bz.v, bphi.v))
+        # 1/(|b||v|) evaluated in place with one square root and reciprocal
+        norm = _dot(b, b)
+        norm *= _dot(v, v)
+        np.reciprocal(np.sqrt(norm, out=norm), out=norm)
+        pitch = _dot(v, b)
+        pitch *= norm
+        return pitch * unyt.dimensionless
 
     @staticmethod
     @parseunits(strip=True, mass="amu", charge="e", r="m", phi="deg", z="m",
@@ -519,8 +538,8 @@ class Prt(Marker):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         n : int
             Number of markers.
         ids : array_like (n,)
@@ -560,44 +579,68 @@ class Prt(Marker):
         Raises
         ------
         ValueError
-            If inputs were not consistent.
+            If inputs were not consistent, marker IDs were not unique
+            positive integers, or species data was not finite.
         """
-        if ids.size    != n: raise ValueError("Inconsistent size for ids.")
-        if mass.size   != n: raise ValueError("Inconsistent size for mass.")
-        if charge.size != n: raise ValueError("Inconsistent size for charge.")
-        if r.size      != n: raise ValueError("Inconsistent size for r.")
-        if phi.size    != n: raise ValueError("Inconsistent size for phi.")
-        if z.size      != n: raise ValueError("Inconsistent size for z.")
-        if vr.size     != n: raise ValueError("Inconsistent size for vR.")
-        if vphi.size   != n: raise ValueError("Inconsistent size for vphi.")
-        if vz.size     != n: raise ValueError("Inconsistent size for vz.")
-        if anum.size   != n: raise ValueError("Inconsistent size for anum.")
-        if znum.size   != n: raise ValueError("Inconsistent size for znum.")
-        if weight.size != n: raise ValueError("Inconsistent size for weight.")
-        if time.size   != n: raise ValueError("Inconsistent size for time.")
-
         parent = "marker"
         group  = "prt"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        # Per-marker fields as (name, argument, data, dtype, unit). The solver
+        # reads each field as a separate dataset so they are all written in
+        # a single pass.
+        fields = [
+            ["r",      "r",      r,      "f8", "m"],
+            ["phi",    "phi",    phi,    "f8", "deg"],
+            ["z",      "z",      z,      "f8", "m"],
+            ["vr",     "vr",     vr,     "f8", "m/s"],
+            ["vphi",   "vphi",   vphi,   "f8", "m/s"],
+            ["vz",     "vz",     vz,     "f8", "m/s"],
+            ["mass",   "mass",   mass,   "f8", "amu"],
+            ["charge", "charge", charge, "i4", "e"],
+            ["anum",   "anum",   anum,   "i4", "1"],
+            ["znum",   "znum",   znum,   "i4", "1"],
+            ["weight", "weight", weight, "f8", "markers/s"],
+            ["time",   "time",   time,   "f8", "s"],
+            ["id",     "ids",    ids,    "i8", "1"],
+        ]
+
+        # Species data is checked before the conversion since casting to
+        # integers would turn non-finite values into arbitrary numbers
+        for name, data in [("mass", mass), ("charge", charge), ("anum", anum),
+                           ("znum", znum)]:
+            if not np.all(np.isfinite(data)):
+                raise ValueError("Marker " + name + " must be finite.")
+
+        # Validate and convert to contiguous arrays of the stored type before
+        # the file is touched, so that h5py can write the buffers as they are.
+        for field in fields:
+            if field[2].size != n:
+                raise ValueError("Inconsistent size for " + field[1] + ".")
+            field[2] = np.ascontiguousarray(field[2], dtype=field[3]).ravel()
+
+        values = {field[0] : field[2] for field in fields}
+        ids = values["id"]
+        if np.any(ids <= 0):
+            raise ValueError("Marker IDs must be positive.")
+        if np.unique(ids).size != n:
+            raise ValueError("Marker IDs must be unique.")
+
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
-            g.create_dataset("n",      (1,), data=n,      dtype='i8').attrs['unit'] = '1';
-            g.create_dataset("r",      (n,), data=r,      dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'm';
-            g.create_dataset("phi",    (n,), data=phi,    dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'deg';
-            g.create_dataset("z",      (n,), data=z,      dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'm';
-            g.create_dataset("vr",     (n,), data=vr,     dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'm/s';
-            g.create_dataset("vphi",   (n,), data=vphi,   dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'm/s';
-            g.create_dataset("vz",     (n,), data=vz,     dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'm/s';
-            g.create_dataset("mass",   (n,), data=mass,   dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'amu';
-            g.create_dataset("charge", (n,), data=charge, dtype='i4', compression="gzip", compression_opts=9).attrs['unit'] = 'e';
-            g.create_dataset("anum",   (n,), data=anum,   dtype='i4', compression="gzip", compression_opts=9).attrs['unit'] = '1';
-            g.create_dataset("znum",   (n,), data=znum,   dtype='i4', compression="gzip", compression_opts=9).attrs['unit'] = '1';
-            g.create_dataset("weight", (n,), data=weight, dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 'markers/s';
-            g.create_dataset("time",   (n,), data=time,   dtype='f8', compression="gzip", compression_opts=9).attrs['unit'] = 's';
-            g.create_dataset("id",     (n,), data=ids,    dtype='i8', compression="gzip", compression_opts=9).attrs['unit'] = '1';
+            # Each field stays contiguous in its own dataset. Chunks hold 2**16
+            # markers so they stay under the 1 MiB default chunk cache. A chunk
+            # cannot exceed the dataset so h5py picks it for empty inputs.
+            chunks = (min(n, 2**16),) if n > 0 else None
+
+            g.create_dataset("n", (1,), data=n, dtype="i8").attrs["unit"] = "1"
+            for name, _, data, dtype, unit in fields:
+                g.create_dataset(name, (n,), data=data, dtype=dtype,
+                                 chunks=chunks, compression="gzip",
+                                 compression_opts=9, dcpl=nofill_dcpl()
+                                 ).attrs["unit"] = unit
 
         return gname
 
@@ -613,8 +656,8 @@ class Prt(Marker):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -623,3 +666,23 @@ class Prt(Marker):
         """
         mrk = Marker.generate(n=1, mrktype="prt", species="alpha")
         return Prt.write_hdf5(fn=fn, desc="DUMMY", **mrk)
+
+def _dot(a, b):
+    """Dot product of two arrays of vectors.
+
+    The products and the sum are evaluated by a single einsum contraction
+    without temporary arrays.
+
+    Parameters
+    ----------
+    a : array_like (3,n)
+        Components of the first vectors.
+    b : array_like (3,n)
+        Components of the second vectors.
+
+    Returns
+    -------
+    dot : array_like (n,)
+        The dot products.
+    """
+    return np.einsum("ij,ij->j", a, b)
@@ -14,7 +14,7 @@ and time. MHD_STAT assumes only psi dependency, making the interpolation
 import h5py
 import numpy as np
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 class MHD_STAT(DataGroup):
@@ -97,8 +97,8 @@ class MHD_STAT(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         nmode : int
             Number of modes.
         nmodes : array_like (nmode,)
@@ -149,7 +149,7 @@ class MHD_STAT(DataGroup):
         group  = "MHD_STAT"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -182,8 +182,8 @@ class MHD_STAT(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -277,8 +277,8 @@ class MHD_NONSTAT(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         nmode : int
             Number of modes.
         nmodes : array_like (nmode,)
@@ -335,7 +335,7 @@ class MHD_NONSTAT(DataGroup):
         group  = "MHD_NONSTAT"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -371,8 +371,8 @@ class MHD_NONSTAT(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
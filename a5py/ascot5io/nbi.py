@@ -9,7 +9,7 @@ import unyt
 
 from a5py.routines.plotting import openfigureifnoaxes
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 class Injector():
@@ -195,8 +195,8 @@ class NBI(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         ninj : int
             Number of injectors.
         injectors : array of :class:`Injector`
@@ -215,7 +215,7 @@ class NBI(DataGroup):
         if ninj != len(injectors):
             raise ValueError("Number of injectors is not the same as len(nbi)")
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -273,8 +273,8 @@ class NBI(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -5,7 +5,7 @@ Neutral data is used in simulations with atomic reactions enabled.
 import numpy as np
 import h5py
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 class N0_1D(DataGroup):
@@ -42,8 +42,8 @@ class N0_1D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         rhomin : float
             Minimum value in rho grid [1].
         rhomax : float
@@ -95,7 +95,7 @@ class N0_1D(DataGroup):
         if maxwellian == 1:
             maxwellian = np.ones( (int(nspecies),1) )
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -128,8 +128,8 @@ class N0_1D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -185,8 +185,8 @@ class N0_3D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         rmin : float
             Minimum value in R grid [m].
         rmax : float
@@ -250,7 +250,7 @@ class N0_3D(DataGroup):
         if maxwellian == 1:
             maxwellian = np.ones( (int(nspecies),1) )
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -285,8 +285,8 @@ class N0_3D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
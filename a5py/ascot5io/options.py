@@ -4,10 +4,22 @@ import h5py
 import numpy as np
 import ast
 import warnings
+import functools
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
+SECTIONS = {
+    "SIM_MODE"               : "SIMULATION MODE AND TIME-STEP",
+    "ENDCOND_SIMTIMELIM"     : "END CONDITIONS",
+    "ENABLE_ORBIT_FOLLOWING" : "PHYSICS",
+    "ENABLE_DIST_5D"         : "DISTRIBUTIONS",
+    "ENABLE_ORBITWRITE"      : "ORBIT WRITE",
+    "ENABLE_TRANSCOEF"       : "TRANSPORT COEFFICIENT",
+}
+"""Section titles keyed by the first option parameter in each section.
+"""
+
 class Opt(DataGroup):
     """Simulation options.
 
@@ -871,11 +883,25 @@ class Opt(DataGroup):
         out = {}
         defopt = Opt.get_default()
         with h5py.File(fn,"r") as f:
-            for key in f[path]:
+            dsets = {}
+            for key, dset in f[path].items():
                 if key not in defopt.keys():
                     warnings.warn("Unknown option " + key + " ignored.")
                     continue
-                val = f[path][key][:]
+                dsets[key] = dset
+
+            # All options are read into a single double precision buffer and
+            # HDF5 converts any dataset stored in another type while reading.
+            # The low-level read is used as the selection handling in h5py
+            # costs more than reading the data.
+            nbuf = sum(dset.size for dset in dsets.values())
+            buf  = np.empty((nbuf,), dtype="f8")
+            i0   = 0
+            for key, dset in dsets.items():
+                val = buf[i0:i0+dset.size].reshape(dset.shape)
+                i0 += dset.size
+                if val.size > 0:
+                    dset.id.read(h5py.h5s.ALL, h5py.h5s.ALL, val)
 
                 # Take type from the default parameter
                 if isinstance(defopt[key], list):
@@ -930,64 +956,42 @@ class Opt(DataGroup):
             else:
                 opt[o] = trim(val)
 
+        def makebanner(title):
+            """Makes a banner with given title.
+            """
+            nchar = len(title)
+            ljust = int((76 - nchar) / 2)
+            banner = []
+            banner += ["#"  + "*"*78 +  "#"]
+            banner += ["#*" + " "*ljust + title
+                       + " "*(76 - nchar - ljust) + "*#"]
+            banner += ["#*" + " "*76 + "*#"]
+            banner += ["#"  + "*"*78 +  "#"]
+            banner += [""]
+            return banner
+
+        # Decorations are prepared once before going through the parameters
+        if descriptions:
+            banners  = {name : makebanner(title)
+                        for name, title in SECTIONS.items()}
+            comments = Opt._build_descriptions()
+
         # Create an array of strings
         out = []
-        for o in self.__dict__.keys():
-            if len(o) < 5 or o[:5] != "_OPT_":
-                continue
-
-            # Extract parameter info
-            attr = o[4:]
-            desc = getattr(Opt, attr).__doc__
-            name = getattr(Opt, attr).fget.__name__[1:]
+        for name in Opt._build_default().keys():
             dval = opt[name]
 
             # Add decorations
             if descriptions:
-
-                def makebanner(title):
-                    """Makes a banner with given title.
-                    """
-                    nchar = len(title)
-                    ljust = int((76 - nchar) / 2)
-                    banner = []
-                    banner += ["#"  + "*"*78 +  "#"]
-                    banner += ["#*" + " "*ljust + title
-                               + " "*(76 - nchar - ljust) + "*#"]
-                    banner += ["#*" + " "*76 + "*#"]
-                    banner += ["#"  + "*"*78 +  "#"]
-                    banner += [""]
-                    return banner
-
-                if name == "SIM_MODE":
-                    out.extend(makebanner("SIMULATION MODE AND TIME-STEP"))
-                elif name == "ENDCOND_SIMTIMELIM":
-                    out.extend(makebanner("END CONDITIONS"))
-                elif name == "ENABLE_ORBIT_FOLLOWING":
-                    out.extend(makebanner("PHYSICS"))
-                elif name == "ENABLE_DIST_5D":
-                    out.extend(makebanner("DISTRIBUTIONS"))
-                elif name == "ENABLE_ORBITWRITE":
-                    out.extend(makebanner("ORBIT WRITE"))
-                elif name == "ENABLE_TRANSCOEF":
-                    out.extend(makebanner("TRANSPORT COEFFICIENT"))
-
-                # Clean docstrings a little bit by removing extra whispace and
-                # empty lines.
-                for d in desc.splitlines():
-                    d = d.lstrip(" ")
-                    if len(d) > 1: out.append("# " + d)
+                out.extend(banners.get(name, []))
+                out.extend(comments[name])
 
             # Write parameter and value after possible decorations
             out.append(name + " = " + str(dval))
             out.append("") # Empty line to separate parameters
 
         if not aslist:
-            string = ""
-            for o in out:
-                string += o + "\n"
-
-            out = string
+            out = "".join(o + "\n" for o in out)
 
         return out
 
@@ -1028,8 +1032,8 @@ class Opt(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to HDF5 file.
+        fn : str or `h5py.File`
+            Full path to HDF5 file or an already open file.
         desc : str, optional
             Input description.
         **kwargs
@@ -1062,16 +1066,27 @@ class Opt(DataGroup):
         group  = "opt"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        # Convert all options to numpy float arrays before the file is opened
+        # so that the group is not left partially written if conversion fails
+        options = {}
+        for param, data in kwargs.items():
+            options[param] = np.asarray(data, dtype="f8")
+
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
-            # Convert all options to numpy float arrays and write
-            for param, data in kwargs.items():
-                data = np.asarray(data)
-
-                data = data.astype("f8")
-                d = g.create_dataset(param, (data.size,), data=data)
+            # Options are mostly scalars so they are stored in the dataset
+            # header (compact layout) where they are read along with the
+            # metadata. They have to be datasets rather than attributes, since
+            # that is what the C code reads. Compact data is limited to 64 KiB
+            # so long lists are stored as usual.
+            for param, data in options.items():
+                dcpl = None
+                if data.nbytes <= 2**15:
+                    dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+                    dcpl.set_layout(h5py.h5d.COMPACT)
+                g.create_dataset(param, (data.size,), data=data, dcpl=dcpl)
 
         return gname
 
@@ -1087,8 +1102,8 @@ class Opt(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -1110,6 +1125,16 @@ class Opt(DataGroup):
             Default options in a format that can be passed to
             :meth:`write_hdf5`.
         """
+        # Defaults are parsed only once but callers are free to modify the
+        # returned dictionary, so it (and any list values) is a copy
+        return {name : list(dval) if isinstance(dval, list) else dval
+                for name, dval in Opt._build_default().items()}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _build_default():
+        """Parse default option parameters from the attributes.
+        """
         out = {}
         defopt = Opt(None, None)
         for opt in defopt.__dict__.keys():
@@ -1123,6 +1148,29 @@ class Opt(DataGroup):
 
         return out
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _build_descriptions():
+        """Convert option docstrings to comment lines.
+
+        Docstrings are constant so they are cleaned only once.
+
+        Returns
+        -------
+        descriptions : dict [str, list [str]]
+            Description of each option parameter as a list of lines.
+        """
+        out = {}
+        for name in Opt._build_default().keys():
+            # Clean docstrings a little bit by removing extra whispace and
+            # empty lines.
+            out[name] = []
+            for d in getattr(Opt, "_" + name).__doc__.splitlines():
+                d = d.lstrip(" ")
+                if len(d) > 1: out[name].append("# " + d)
+
+        return out
+
     @staticmethod
     def validate():
         """
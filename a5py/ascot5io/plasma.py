@@ -6,7 +6,7 @@ diagnostics enabled. This includes BBNBI5 and ASCOT-BMC.
 import h5py
 import numpy as np
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 import a5py.routines.plotting as a5plt
@@ -97,8 +97,8 @@ class plasma_1D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Path to hdf5 file.
+        fn : str or `h5py.File`
+            Path to hdf5 file or an already open file.
         nrho : int
             Number of rho grid points.
         nion : int
@@ -149,7 +149,7 @@ class plasma_1D(DataGroup):
         group  = "plasma_1D"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -184,8 +184,8 @@ class plasma_1D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -291,8 +291,8 @@ class plasma_1DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Path to hdf5 file.
+        fn : str or `h5py.File`
+            Path to hdf5 file or an already open file.
         nrho : int
             Number of rho grid points.
         nion : int
@@ -345,7 +345,7 @@ class plasma_1DS(DataGroup):
         group  = "plasma_1DS"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -381,8 +381,8 @@ class plasma_1DS(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -428,8 +428,8 @@ class plasma_1Dt(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Path to hdf5 file.
+        fn : str or `h5py.File`
+            Path to hdf5 file or an already open file.
         nrho : int
             Number of rho grid points.
         ntime : int
@@ -482,7 +482,7 @@ class plasma_1Dt(DataGroup):
         group  = "plasma_1Dt"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -519,8 +519,8 @@ class plasma_1Dt(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -12,7 +12,7 @@ import h5py
 import numpy as np
 import unyt
 
-from .coreio.fileapi import add_group
+from .coreio.fileapi import add_group, ascot5_writer
 from .coreio.treedata import DataGroup
 
 import a5py.physlib as physlib
@@ -58,8 +58,8 @@ class wall_2D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         nelements : int
             Number of wall segments.
         r : array_like (nelements,1)
@@ -88,7 +88,7 @@ class wall_2D(DataGroup):
         group  = "wall_2D"
         gname  = ""
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -156,8 +156,8 @@ class wall_2D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -596,8 +596,8 @@ class wall_3D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
         nelements : int
             Number of wall triangles
         x1x2x3 : array_like (nelements,3)
@@ -670,7 +670,7 @@ class wall_3D(DataGroup):
             for istr,s in enumerate(flagIdStrings):
                 fids[istr]=s
 
-        with h5py.File(fn, "a") as f:
+        with ascot5_writer(fn) as f:
             g = add_group(f, parent, group, desc=desc)
             gname = g.name.split("/")[-1]
 
@@ -701,8 +701,8 @@ class wall_3D(DataGroup):
 
         Parameters
         ----------
-        fn : str
-            Full path to the HDF5 file.
+        fn : str or `h5py.File`
+            Full path to the HDF5 file or an already open file.
 
         Returns
         -------
@@ -19,6 +19,10 @@ from .libproviders import LibProviders
 if _LIBASCOT:
     from . import ascot2py
 
+_PLASMAQNT = frozenset(["ne", "te"] + ["ni" + str(i+1) for i in range(99)]
+                       + ["ti" + str(i+1) for i in range(99)])
+"""Names of the quantities that are evaluated from the plasma input."""
+
 class Ascotpy(LibAscot, LibSimulate, LibProviders):
     """Class with methods to initialize and access the data via Python.
 
@@ -675,16 +679,19 @@ class Ascotpy(LibAscot, LibSimulate, LibProviders):
             if t.size == 1:
                 t = t[0]*np.ones((arrsize,))
 
+        # Requested quantities as a set for constant time membership tests
+        qset = frozenset(qnt)
+
         out = {}
-        if any(q in qnt for q in ["rho", "psi", "rhodpsi", "psidr", "psidphi",
-                                  "psidz"]):
+        if any(q in qset for q in ["rho", "psi", "rhodpsi", "psidr", "psidphi",
+                                   "psidz"]):
             out.update(**self._eval_bfield(r, phi, z, t, evalrho=True))
-        if any(q in qnt for q in ["br", "bphi", "bz", "brdr", "brdphi", "brdz",
-                                  "bphidr", "bphidphi", "bphidz", "bzdr",
-                                  "bzdphi", "bzdz", "divb", "bnorm",
-                                  "jnorm", "jr", "jphi", "jz", "gradbr",
-                                  "gradbphi", "gradbz", "curlbr", "curlbphi",
-                                  "curlbz"]):
+        if any(q in qset for q in ["br", "bphi", "bz", "brdr", "brdphi",
+                                   "brdz", "bphidr", "bphidphi", "bphidz",
+                                   "bzdr", "bzdphi", "bzdz", "divb", "bnorm",
+                                   "jnorm", "jr", "jphi", "jz", "gradbr",
+                                   "gradbphi", "gradbz", "curlbr", "curlbphi",
+                                   "curlbz"]):
             out.update(self._eval_bfield(r, phi, z, t, evalb=True))
             out["divb"] = out["br"]/r + out["brdr"] + out["bphidphi"]/r \
                 + out["bzdz"]
@@ -704,40 +711,40 @@ class Ascotpy(LibAscot, LibSimulate, LibProviders):
             out["curlbr"]   = out["bzdphi"] / r - out["bphidz"]
             out["curlbphi"] = out["brdz"] - out["bzdr"]
             out["curlbz"]   = (out["bphi"] - out["brdphi"]) / r + out["bphidr"]
-        if any(q in qnt for q in ["axisr", "axisz"]):
+        if any(q in qset for q in ["axisr", "axisz"]):
             out.update(self._eval_bfield(r, phi, z, t, evalaxis=True))
-        if any(q in qnt for q in ["er", "ephi", "ez"]):
+        if any(q in qset for q in ["er", "ephi", "ez"]):
             out.update(self._eval_efield(r, phi, z, t))
-        if any(q in qnt for q in ["n0"]):
+        if any(q in qset for q in ["n0"]):
             out.update(self._eval_neutral(r, phi, z, t))
-        if any(q in qnt for q in ["psi (bzr)", "theta", "zeta", "dpsidr (bzr)",
-                                  "dpsidphi (bzr)", "dpsidz (bzr)", "dthetadr",
-                                  "dthetadphi", "dthetadz", "dzetadr",
-                                  "dzetadphi", "dzetadz", "rho (bzr)"]):
+        if any(q in qset for q in ["psi (bzr)", "theta", "zeta",
+                                   "dpsidr (bzr)", "dpsidphi (bzr)",
+                                   "dpsidz (bzr)", "dthetadr",
+                                   "dthetadphi", "dthetadz", "dzetadr",
+                                   "dzetadphi", "dzetadz", "rho (bzr)"]):
             out.update(self._eval_boozer(r, phi, z, t))
-        if any(q in qnt for q in ["qprof", "bjac", "bjacxb2"]):
+        if any(q in qset for q in ["qprof", "bjac", "bjacxb2"]):
             out.update(self._eval_boozer(r, phi, z, t, evalfun=True))
-        if any(q in qnt for q in ["alphaeig", "phieig"]):
-            out.update(self._eval_mhd(r, phi, z, t, evalpot=True))
-        if any(q in qnt for q in ["mhd_br", "mhd_bphi", "mhd_bz", "mhd_er",
-                                  "mhd_ephi", "mhd_ez", "mhd_phi"]):
-            out.update(self._eval_mhd(r, phi, z, t))
-        if any(q in qnt for q in ["db/b (mhd)"]):
-            bpert = self._eval_mhd(r, phi, z, t)
+        # Perturbation is always evaluated along with the eigenfunctions so
+        # all MHD quantities are obtained with a single evaluation
+        evalpot = any(q in qset for q in ["alphaeig", "phieig"])
+        if evalpot or any(q in qset for q in ["mhd_br", "mhd_bphi", "mhd_bz",
+                                              "mhd_er", "mhd_ephi", "mhd_ez",
+                                              "mhd_phi", "db/b (mhd)"]):
+            out.update(self._eval_mhd(r, phi, z, t, evalpot=evalpot))
+        if any(q in qset for q in ["db/b (mhd)"]):
             b = self._eval_bfield(r, phi, z, t, evalb=True)
-            bpert = np.sqrt(  bpert["mhd_br"]**2
-                            + bpert["mhd_bphi"]**2
-                            + bpert["mhd_bz"]**2)
+            bpert = np.sqrt(  out["mhd_br"]**2
+                            + out["mhd_bphi"]**2
+                            + out["mhd_bz"]**2)
             b = np.sqrt(b["br"]**2 + b["bphi"]**2 + b["bz"]**2)
             out["db/b (mhd)"] = bpert/b
 
-        ni = ["ni" + str(i+1) for i in range(99)]
-        ti = ["ti" + str(i+1) for i in range(99)]
-        if any(q in qnt for q in ["ne", "te"] + ni + ti):
+        if not qset.isdisjoint(_PLASMAQNT):
             out.update(self._eval_plasma(r, phi, z, t))
 
         for q in list(out.keys()):
-            if q not in qnt:
+            if q not in qset:
                 del out[q]
             elif grid:
                 out[q] = np.reshape(out[q], arrsize)
@@ -63,6 +63,26 @@ except ImportError as error:
         "Some functionalities of Ascot are not available"
     warnings.warn(msg, stacklevel=4)
 
+def _nans(shape, unit):
+    """Allocate an array filled with NaNs to be used as an output buffer.
+
+    The array is wrapped with units without a copy so that libascot.so writes
+    directly to the returned array.
+
+    Parameters
+    ----------
+    shape : tuple [int]
+        Shape of the array.
+    unit : :obj:`unyt.Unit`
+        Units of the array.
+
+    Returns
+    -------
+    arr : :obj:`unyt.unyt_array`
+        The allocated array.
+    """
+    return unyt.unyt_array(np.full(shape, np.nan), unit)
+
 class LibAscot:
     """Python wrapper of libascot.so.
     """
@@ -106,18 +126,18 @@ class LibAscot:
 
         if evalb:
             Tperm = unyt.T / unyt.m
-            out["br"]       = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.T
-            out["bphi"]     = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.T
-            out["bz"]       = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.T
-            out["brdr"]     = (np.zeros(r.shape, dtype="f8") + np.nan) * Tperm
-            out["brdphi"]   = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.T
-            out["brdz"]     = (np.zeros(r.shape, dtype="f8") + np.nan) * Tperm
-            out["bphidr"]   = (np.zeros(r.shape, dtype="f8") + np.nan) * Tperm
-            out["bphidphi"] = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.T
-            out["bphidz"]   = (np.zeros(r.shape, dtype="f8") + np.nan) * Tperm
-            out["bzdr"]     = (np.zeros(r.shape, dtype="f8") + np.nan) * Tperm
-            out["bzdphi"]   = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.T
-            out["bzdz"]     = (np.zeros(r.shape, dtype="f8") + np.nan) * Tperm
+            out["br"]       = _nans(r.shape, unyt.T)
+            out["bphi"]     = _nans(r.shape, unyt.T)
+            out["bz"]       = _nans(r.shape, unyt.T)
+            out["brdr"]     = _nans(r.shape, Tperm)
+            out["brdphi"]   = _nans(r.shape, unyt.T)
+            out["brdz"]     = _nans(r.shape, Tperm)
+            out["bphidr"]   = _nans(r.shape, Tperm)
+            out["bphidphi"] = _nans(r.shape, unyt.T)
+            out["bphidz"]   = _nans(r.shape, Tperm)
+            out["bzdr"]     = _nans(r.shape, Tperm)
+            out["bzdphi"]   = _nans(r.shape, unyt.T)
+            out["bzdz"]     = _nans(r.shape, Tperm)
 
             fun = _LIBASCOT.libascot_B_field_eval_B_dB
             fun.restype  = None
@@ -134,16 +154,12 @@ class LibAscot:
                 out["bzdz"])
 
         if evalrho:
-            out["psi"] = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.Wb
-            out["rho"] = (np.zeros(r.shape, dtype="f8") + np.nan) \
-                * unyt.dimensionless
-            out["rhodpsi"] = (np.zeros(r.shape, dtype="f8") + np.nan) / unyt.Wb
-            out["psidr"] = (np.zeros(r.shape, dtype="f8") + np.nan) \
-                * unyt.Wb / unyt.m
-            out["psidphi"] = (np.zeros(r.shape, dtype="f8") + np.nan) \
-                * unyt.Wb
-            out["psidz"] = (np.zeros(r.shape, dtype="f8") + np.nan) \
-                * unyt.Wb / unyt.m
+            out["psi"] = _nans(r.shape, unyt.Wb)
+            out["rho"] = _nans(r.shape, unyt.dimensionless)
+            out["rhodpsi"] = _nans(r.shape, 1/unyt.Wb)
+            out["psidr"] = _nans(r.shape, unyt.Wb / unyt.m)
+            out["psidphi"] = _nans(r.shape, unyt.Wb)
+            out["psidz"] = _nans(r.shape, unyt.Wb / unyt.m)
 
             fun = _LIBASCOT.libascot_B_field_eval_rho
             fun.restype  = None
@@ -157,8 +173,8 @@ class LibAscot:
                 out["psidr"], out["psidphi"], out["psidz"])
 
         if evalaxis:
-            out["axisr"] = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.m
-            out["axisz"] = (np.zeros(r.shape, dtype="f8") + np.nan) * unyt.m
+            out["axisr"] = _nans(r.shape, unyt.m)
+            out["axisz"] = _nans(r.shape, unyt.m)
 
             fun = _LIBASCOT.libascot_B_field_get_axis
             fun.restype  = None
@@ -200,9 +216,9 @@ class LibAscot:
         Neval = r.size
         out = {}
         Vperm = unyt.V / unyt.m
-        out["er"]   = (np.zeros(r.shape, dtype="f8") + np.nan) * Vperm
-        out["ephi"] = (np.zeros(r.shape, dtype="f8") + np.nan) * Vperm
-        out["ez"]   = (np.zeros(r.shape, dtype="f8") + np.nan) * Vperm
+        out["er"]   = _nans(r.shape, Vperm)
+        out["ephi"] = _nans(r.shape, Vperm)
+        out["ez"]   = _nans(r.shape, Vperm)
 
         fun = _LIBASCOT.libascot_E_field_eval_E
         fun.restype  = None
@@ -248,8 +264,8 @@ class LibAscot:
         m3 = unyt.m**3
         eV = unyt.eV
         nspecies  = self.input_getplasmaspecies()[0] + 1
-        rawdens = (np.zeros((Neval*nspecies,), dtype="f8") + np.nan) / m3
-        rawtemp = (np.zeros((Neval*nspecies,), dtype="f8") + np.nan) * eV
+        rawdens = _nans((Neval*nspecies,), 1/m3)
+        rawtemp = _nans((Neval*nspecies,), eV)
 
         fun = _LIBASCOT.libascot_plasma_eval_background
         fun.restype  = None
@@ -300,7 +316,7 @@ class LibAscot:
         Neval = r.size
         out = {}
         m3 = unyt.m**3
-        out["n0"] = (np.zeros(r.shape, dtype="f8") + np.nan) / m3
+        out["n0"] = _nans(r.shape, 1/m3)
 
         fun = _LIBASCOT.libascot_neutral_eval_density
         fun.restype  = None
@@ -342,13 +358,12 @@ class LibAscot:
         self._requireinit("bfield", "boozer")
         Neval = r.size
         out = {}
-        temp = np.zeros(r.shape, dtype="f8")
         nodim = unyt.dimensionless
         T = unyt.T; Wb = unyt.Wb; m = unyt.m; rad = unyt.rad
         if evalfun:
-            out["qprof"]   = (np.copy(temp) + np.nan) * nodim
-            out["bjac"]    = (np.copy(temp) + np.nan) / T**2
-            out["bjacxb2"] = (np.copy(temp) + np.nan) * nodim
+            out["qprof"]   = _nans(r.shape, nodim)
+            out["bjac"]    = _nans(r.shape, 1/T**2)
+            out["bjacxb2"] = _nans(r.shape, nodim)
 
             fun = _LIBASCOT.libascot_boozer_eval_fun
             fun.restype  = ctypes.c_int
@@ -361,19 +376,19 @@ class LibAscot:
                 Neval, r, phi, z, t, out["qprof"], out["bjac"],
                 out["bjacxb2"])
         else:
-            out["psi (bzr)"]      = (np.copy(temp) + np.nan) * Wb
-            out["theta"]          = (np.copy(temp) + np.nan) * rad
-            out["zeta"]           = (np.copy(temp) + np.nan) * rad
-            out["dpsidr (bzr)"]   = (np.copy(temp) + np.nan) * Wb/m
-            out["dpsidphi (bzr)"] = (np.copy(temp) + np.nan) * Wb
-            out["dpsidz (bzr)"]   = (np.copy(temp) + np.nan) * Wb/m
-            out["dthetadr"]       = (np.copy(temp) + np.nan) / m
-            out["dthetadphi"]     = (np.copy(temp) + np.nan) * nodim
-            out["dthetadz"]       = (np.copy(temp) + np.nan) / m
-            out["dzetadr"]        = (np.copy(temp) + np.nan) / m
-            out["dzetadphi"]      = (np.copy(temp) + np.nan) * nodim
-            out["dzetadz"]        = (np.copy(temp) + np.nan) / m
-            out["rho (bzr)"]      = (np.copy(temp) + np.nan) * nodim
+            out["psi (bzr)"]      = _nans(r.shape, Wb)
+            out["theta"]          = _nans(r.shape, rad)
+            out["zeta"]           = _nans(r.shape, rad)
+            out["dpsidr (bzr)"]   = _nans(r.shape, Wb/m)
+            out["dpsidphi (bzr)"] = _nans(r.shape, Wb)
+            out["dpsidz (bzr)"]   = _nans(r.shape, Wb/m)
+            out["dthetadr"]       = _nans(r.shape, 1/m)
+            out["dthetadphi"]     = _nans(r.shape, nodim)
+            out["dthetadz"]       = _nans(r.shape, 1/m)
+            out["dzetadr"]        = _nans(r.shape, 1/m)
+            out["dzetadphi"]      = _nans(r.shape, nodim)
+            out["dzetadz"]        = _nans(r.shape, 1/m)
+            out["rho (bzr)"]      = _nans(r.shape, nodim)
 
             fun = _LIBASCOT.libascot_boozer_eval_psithetazeta
             fun.restype  = ctypes.c_int
@@ -429,14 +444,14 @@ class LibAscot:
         Neval = r.size
         out = {}
         T = unyt.T; V = unyt.V; m = unyt.m; s = unyt.s
-        temp = np.zeros(r.shape, dtype="f8")
-        out["mhd_br"]   = (np.copy(temp) + np.nan) * T
-        out["mhd_bphi"] = (np.copy(temp) + np.nan) * T
-        out["mhd_bz"]   = (np.copy(temp) + np.nan) * T
-        out["mhd_er"]   = (np.copy(temp) + np.nan) * V/m
-        out["mhd_ephi"] = (np.copy(temp) + np.nan) * V/m
-        out["mhd_ez"]   = (np.copy(temp) + np.nan) * V/m
-        out["mhd_phi"]  = (np.copy(temp) + np.nan) * V
+
+        out["mhd_br"]   = _nans(r.shape, T)
+        out["mhd_bphi"] = _nans(r.shape, T)
+        out["mhd_bz"]   = _nans(r.shape, T)
+        out["mhd_er"]   = _nans(r.shape, V/m)
+        out["mhd_ephi"] = _nans(r.shape, V/m)
+        out["mhd_ez"]   = _nans(r.shape, V/m)
+        out["mhd_phi"]  = _nans(r.shape, V)
 
         fun = _LIBASCOT.libascot_mhd_eval_perturbation
         fun.restype  = None
@@ -452,16 +467,16 @@ class LibAscot:
             out["mhd_phi"])
 
         if evalpot:
-            out["alphaeig"] = (np.copy(temp) + np.nan) * m
-            out["phieig"]   = (np.copy(temp) + np.nan) * V
-            out["dadt"]     = (np.copy(temp) + np.nan) * T*m/s
-            out["dadr"]     = (np.copy(temp) + np.nan) * T
-            out["dadphi"]   = (np.copy(temp) + np.nan) * T*m
-            out["dadz"]     = (np.copy(temp) + np.nan) * T
-            out["dphidt"]   = (np.copy(temp) + np.nan) * V/s
-            out["dphidr"]   = (np.copy(temp) + np.nan) * V/m
-            out["dphidphi"] = (np.copy(temp) + np.nan) * V
-            out["dphidz"]   = (np.copy(temp) + np.nan) * V/m
+            out["alphaeig"] = _nans(r.shape, m)
+            out["phieig"]   = _nans(r.shape, V)
+            out["dadt"]     = _nans(r.shape, T*m/s)
+            out["dadr"]     = _nans(r.shape, T)
+            out["dadphi"]   = _nans(r.shape, T*m)
+            out["dadz"]     = _nans(r.shape, T)
+            out["dphidt"]   = _nans(r.shape, V/s)
+            out["dphidr"]   = _nans(r.shape, V/m)
+            out["dphidphi"] = _nans(r.shape, V)
+            out["dphidz"]   = _nans(r.shape, V/m)
 
             fun = _LIBASCOT.libascot_mhd_eval
             fun.restype  = None
@@ -707,7 +722,7 @@ class LibAscot:
 
         out = {}
         units = unyt.m**3 / unyt.s
-        out["sigmav"] = (np.zeros((Neval,Nv), dtype="f8") + np.nan) * units
+        out["sigmav"] = _nans((Neval,Nv), units)
         fun(ctypes.byref(self._sim), self._bfield_offload_array,
             self._plasma_offload_array, self._neutral_offload_array,
             self._asigma_offload_array, Neval, r, phi, z, t, Nv, va,
@@ -122,18 +122,13 @@ class Afsi():
             raise ValueError("Reactant species not present in plasma input.")
         mult = 0.5 if ispecies1 == ispecies2 else 1.0
 
-        temp  = np.zeros((nr, nphi, nz))
-        dens1 = np.zeros((nr, nphi, nz))
-        dens2 = np.zeros((nr, nphi, nz))
-        for j in range(nphi):
-            for i in range(nr):
-                for k in range(nz):
-                    temp[i,j,k]  = self._ascot.input_eval(
-                        r[i], phi[j], z[k], time, "ti1").to("J")
-                    dens1[i,j,k] = self._ascot.input_eval(
-                        r[i], phi[j], z[k], time, "ni"+str(ispecies1))
-                    dens2[i,j,k] = self._ascot.input_eval(
-                        r[i], phi[j], z[k], time,"ni"+str(ispecies2))
+        # All quantities are evaluated on the grid with a single call
+        temp, dens1, dens2 = self._ascot.input_eval(
+            r, phi, z, time, "ti1", "ni"+str(ispecies1), "ni"+str(ispecies2),
+            grid=True)
+        temp  = temp[:,:,:,0].to("J").v
+        dens1 = dens1[:,:,:,0].v
+        dens2 = dens2[:,:,:,0].v
 
         thermal1 = self._init_thermal_data(
             minr, maxr, nr, minphi, maxphi, nphi, minz, maxz, nz, temp, dens1)
@@ -246,15 +241,11 @@ class Afsi():
             self._ascot.input_free(bfield=True, plasma=True)
             raise ValueError("Reactant species not present in plasma input.")
 
-        temp = np.zeros((nr, nphi, nz))
-        dens = np.zeros((nr, nphi, nz))
-        for j in range(nphi):
-            for i in range(nr):
-                for k in range(nz):
-                    temp[i,j,k] = self._ascot.input_eval(
-                        r[i], phi[j], z[k], time, "ti1").to("J")
-                    dens[i,j,k] = self._ascot.input_eval(
-                        r[i], phi[j], z[k], time, "ni"+str(ispecies))
+        # All quantities are evaluated on the grid with a single call
+        temp, dens = self._ascot.input_eval(
+            r, phi, z, time, "ti1", "ni"+str(ispecies), grid=True)
+        temp = temp[:,:,:,0].to("J").v
+        dens = dens[:,:,:,0].v
 
         thermal = self._init_thermal_data(
             minr, maxr, nr, minphi, maxphi, nphi, minz, maxz, nz, temp, dens)
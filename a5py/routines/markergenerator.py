@@ -11,13 +11,6 @@ from scipy.interpolate import RegularGridInterpolator
 import a5py.marker.phasespace as phasespace
 from a5py.ascotpy.ascotpy import Ascotpy
 
-import importlib.util as util
-
-plt = util.find_spec("matplotlib")
-if plt:
-    import matplotlib.pyplot as plt
-    from matplotlib.gridspec import GridSpec
-
 def gen_markerdist(a5, mass, charge, energy, rgrid, zgrid, kgrid,
                    rhoksidist=None, plot=False):
     """
@@ -328,6 +321,9 @@ def plotdist(dist, axes=None):
     """
     Plot distribution in Rz and in ksi.
     """
+    # Imported here as pyplot is slow to import and only needed for plotting
+    import matplotlib.pyplot as plt
+    from matplotlib.gridspec import GridSpec
 
     if axes is None:
         fig = plt.figure()
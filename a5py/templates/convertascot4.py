@@ -498,7 +498,8 @@ class Ascot4Templates():
             f.readline() # Skip comment line
             data["nrho"] = int(float(f.readline().split()[0]))
 
-            h5data = np.loadtxt(f)
+            # Only the first two columns are used so parse just those
+            h5data = np.loadtxt(f, dtype=np.float64, usecols=(0, 1), ndmin=2)
 
             rho = h5data[:,0]
             data["rhomin"]  = h5data[0,0]
@@ -506,12 +507,13 @@ class Ascot4Templates():
             data["dvdrho"] = h5data[:,1]
             # For data in format dV/rho, we can ignore effective minor radius
 
-        # Make sure the input is linearly spaced. If not, interpolate
+        # Data that is already on a uniform grid of nrho points is used as is.
+        # Otherwise interpolate to such grid.
         tol = 1.0001
         diff = np.diff(rho)
-        if ( max(diff)/min(diff) > tol):
+        if rho.size != data["nrho"] or np.amax(diff) > tol * np.amin(diff):
             warnings.warn("Interpolating dV/drho to uniform grid")
-            new_rho = np.linspace(np.amin(rho), np.amax(rho), data["nrho"])
+            new_rho = np.linspace(data["rhomin"], data["rhomax"], data["nrho"])
             data["dvdrho"] = np.interp(new_rho, rho, data["dvdrho"])
 
         data["reff"] = reff
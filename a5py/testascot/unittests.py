@@ -10,6 +10,7 @@ import subprocess
 import importlib
 import matplotlib.pyplot as plt
 
+import a5py.physlib as physlib
 import a5py.routines.plotting as a5plt
 from a5py import Ascot, AscotInitException, AscotIOException
 from a5py.ascot5io.coreio import fileapi
@@ -339,6 +340,118 @@ class TestAscot5IO(unittest.TestCase):
                 a5.data[parent].DUMMY.destroy()
                 a5.data[parent].DUMMY2.destroy()
 
+        # Inputs without markers are valid
+        mrk = Marker.generate("prt", n=0)
+        a5.data.create_input("prt", desc="EMPTY", **mrk)
+        a5 = Ascot(self.testfilename)
+        data = a5.data.marker.EMPTY.read()
+        self.assertEqual(data["n"], 0, "Writing empty marker input failed")
+        self.assertEqual(data["ids"].size, 0,
+                         "Writing empty marker input failed")
+
+    def test_openfile(self):
+        """Test writing inputs to an HDF5 file that is already open.
+        """
+        from a5py.ascot5io import B_2DS, E_TC, Prt, Opt, plasma_1D
+        with fileapi.ascot5_writer(self.testfilename) as f:
+            B_2DS.write_hdf5_dummy(f)
+            E_TC.write_hdf5_dummy(f)
+            Opt.write_hdf5_dummy(f)
+            self.assertTrue(f.id.valid, "Writer closed an open file")
+
+            # The root group can be given instead but no other group
+            Prt.write_hdf5_dummy(f["/"])
+            with self.assertRaises(ValueError):
+                plasma_1D.write_hdf5_dummy(f["options"])
+
+        a5 = Ascot(self.testfilename)
+        for parent in ["bfield", "efield", "options", "marker"]:
+            a5.data[parent].DUMMY.read()
+        self.assertFalse("plasma" in a5.data, "Input written to a subgroup")
+        ids = a5.data.marker.DUMMY.read()["ids"]
+        np.testing.assert_array_equal(
+            ids, Marker.generate(n=1, mrktype="prt", species="alpha")["ids"])
+        exyz = a5.data.efield.DUMMY.read()["exyz"]
+        np.testing.assert_array_equal(exyz.ravel(), np.zeros((3,)))
+
+    def test_efield3ds(self):
+        """Test writing and reading E_3DS which is not yet in the data tree.
+        """
+        from a5py.ascot5io.efield import E_3DS
+        a5 = Ascot(self.testfilename, create=True)
+        nr, nphi, nz = 4, 5, 6
+        rng  = np.random.default_rng(0)
+        data = {"rmin" : 1, "rmax" : 3, "nr" : nr, "zmin" : -2, "zmax" : 2,
+                "nz" : nz, "phimin" : 0, "phimax" : 360, "nphi" : nphi}
+        for comp in ["er", "ephi", "ez"]:
+            data[comp] = rng.random((nr, nphi, nz))
+
+        gname = E_3DS.write_hdf5(self.testfilename, **data)
+        efield = E_3DS(a5.data, "/efield/" + gname)
+        out = efield.read()
+        for comp in ["er", "ephi", "ez"]:
+            self.assertEqual(out[comp].shape, (nr, nphi, nz),
+                             "E_3DS component has a wrong shape")
+            np.testing.assert_allclose(out[comp], data[comp], rtol=1e-6)
+
+        r, phi, z = efield.grid()
+        np.testing.assert_array_equal(r, np.linspace(1, 3, nr))
+        np.testing.assert_array_equal(
+            phi, np.linspace(0, 360, nphi+1)[:-1])
+        np.testing.assert_array_equal(z, np.linspace(-2, 2, nz))
+
+        # Inputs written without the grid reconstruct it from the limits
+        with h5py.File(self.testfilename, "a") as h5:
+            for key in ["r_grid", "phi_grid", "z_grid"]:
+                del h5["efield"][gname][key]
+        for val, ref in zip(efield.grid(), (r, phi, z)):
+            np.testing.assert_allclose(val, ref)
+
+        # Data that was read can be written back as it is
+        gname = E_3DS.write_hdf5(self.testfilename, **out)
+        out2  = E_3DS(a5.data, "/efield/" + gname).read()
+        for comp in ["er", "ephi", "ez"]:
+            np.testing.assert_array_equal(out2[comp], out[comp])
+
+        # Components are stored in single precision unless requested otherwise
+        # but they are always read in double precision
+        gname64 = E_3DS.write_hdf5(self.testfilename, precision="f8", **data)
+        out64   = E_3DS(a5.data, "/efield/" + gname64).read()
+        with h5py.File(self.testfilename, "r") as h5:
+            for comp in ["er", "ephi", "ez"]:
+                self.assertEqual(h5["efield"][gname][comp].dtype, np.float32,
+                                 "E_3DS default precision is not single")
+                self.assertEqual(h5["efield"][gname64][comp].dtype,
+                                 np.float64, "E_3DS precision was ignored")
+        for comp in ["er", "ephi", "ez"]:
+            self.assertEqual(out[comp].dtype, np.float64,
+                             "E_3DS was not read in double precision")
+            np.testing.assert_array_equal(out64[comp], data[comp])
+        with self.assertRaises(ValueError):
+            E_3DS.write_hdf5(self.testfilename, precision="f2", **data)
+
+    def test_markervalidation(self):
+        """Test that invalid particle marker input is rejected.
+        """
+        from a5py.ascot5io.marker import Prt
+        invalid = {
+            "non-positive IDs"   : {"ids" : np.array([0, 1, 2])},
+            "duplicate IDs"      : {"ids" : np.array([1, 2, 2])},
+            "non-finite mass"    : {"mass" : np.array([4, np.nan, 4])
+                                    * unyt.amu},
+            "non-finite charge"  : {"charge" : np.array([2, np.nan, 2])
+                                    * unyt.e},
+            "non-finite anum"    : {"anum" : np.array([4, 4, np.inf])},
+            "non-finite znum"    : {"znum" : np.array([np.nan, 2, 2])},
+        }
+        for case, values in invalid.items():
+            mrk = Marker.generate("prt", n=3, species="alpha")
+            mrk.update(values)
+            with self.assertRaises(
+                    ValueError,
+                    msg="Failed to raise exception for " + case):
+                Prt.write_hdf5(self.testfilename, **mrk)
+
     def tearDown(self):
         """Remove the file used in testing.
         """
@@ -603,6 +716,36 @@ class TestAscot(unittest.TestCase):
             out = a5.data.active.getorbit(q)
         a5.simulation_free()
 
+    def test_markereval(self):
+        """Test evaluation of particle marker energy and pitch.
+        """
+        a5 = Ascot("unittest.h5")
+        mrk = Marker.generate("prt", n=10, species="alpha")
+        mrk["r"][:]    = np.linspace(6.2, 8.2, 10)
+        mrk["vr"][:]   = 1e6
+        mrk["vphi"][:] = np.linspace(-1e7, 1e7, 10)
+        mrk["vz"][:]   = -2e6
+        name = a5.data.create_input("prt", desc="EVAL", activate=False, **mrk)
+        prt  = a5.data.marker[name]
+
+        a5.input_init(bfield=True)
+        pitch  = prt.eval_pitch(a5)
+        energy = prt.eval_energy(a5)
+
+        # Reference values evaluated directly
+        br, bphi, bz = a5.input_eval(mrk["r"], mrk["phi"], mrk["z"],
+                                     0*unyt.s, "br", "bphi", "bz")
+        a5.input_free()
+        vnorm = np.sqrt(mrk["vr"]**2 + mrk["vphi"]**2 + mrk["vz"]**2)
+        bnorm = np.sqrt(br**2 + bphi**2 + bz**2)
+        vpar  = ( mrk["vr"]*br + mrk["vphi"]*bphi + mrk["vz"]*bz ) / bnorm
+        ekin  = physlib.energy_velocity(mrk["mass"], vnorm)
+
+        self.assertTrue(np.allclose(pitch.v, (vpar/vnorm).v),
+                        "Marker pitch evaluation failed")
+        self.assertTrue(np.allclose(energy.to("eV").v, ekin.to("eV").v),
+                        "Marker energy evaluation failed")
+
     def test_dist(self):
         """Test distribution postprocessing.
         """